@@ -0,0 +1,182 @@
+"""
+FASTAPI SERVING APPLICATION - Production-Ready ML Model Serving
+===============================================================
+
+Production entry point: the REST API only, with NO Gradio import. Gradio
+pulls in heavy dependencies (matplotlib, altair, websockets, ...) that
+inflate the container image and per-worker memory footprint, which slows
+image pulls and autoscaler cold starts. The demo UI lives in src/app/ui.py
+and runs as a separate process.
+
+Run in production with:
+    uvicorn src.app.api:app --workers N
+
+or, to load the model once in the master and share it copy-on-write
+across forked workers (N x memory saving, faster autoscale spawns):
+    gunicorn -k uvicorn.workers.UvicornWorker --preload --workers N src.app.api:app
+
+Architecture:
+- FastAPI: High-performance REST API with automatic OpenAPI documentation
+- Pydantic: Data validation and automatic API documentation
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Literal
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, confloat, conint
+from src.serving.inference import load_model, predict_many  # Core ML inference logic
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context: load the model and start the batching worker.
+
+    Model loading happens here rather than at import so a preloading
+    Gunicorn master imports the app cheaply and each forked worker (or
+    the master itself under --preload) initializes exactly once.
+    """
+    global _request_queue
+    load_model()
+    _request_queue = asyncio.Queue()
+    worker = asyncio.create_task(_batch_worker())
+    yield
+    worker.cancel()
+
+
+# Initialize FastAPI application
+# orjson serializes the small response payloads several times faster than
+# the stdlib json encoder — measurable now that prediction itself is fast
+app = FastAPI(
+    title="WOW Player Churn Prediction API",
+    description="ML API for predicting player churn in WoW world",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# === DYNAMIC REQUEST BATCHING CONFIGURATION ===
+# Single-row requests are enqueued and drained by a background worker into
+# one batched model call. This amortizes DataFrame construction and XGBoost
+# dispatch overhead across concurrent requests: throughput scales roughly
+# linearly with batch size until the model call saturates.
+MAX_BATCH_SIZE = 32      # Maximum rows per batched model.predict call
+MAX_LATENCY_MS = 5       # Maximum time to wait for more requests to arrive
+
+_request_queue: asyncio.Queue = None
+
+
+async def _batch_worker():
+    """
+    Background coroutine that drains the request queue into batched predictions.
+
+    Loop:
+    1. Block until at least one request is queued
+    2. Keep collecting requests until MAX_BATCH_SIZE is reached or no new
+       request arrives within MAX_LATENCY_MS
+    3. Run ONE batched inference call for the whole group
+    4. Resolve each request's future with its individual result
+    """
+    while True:
+        batch = [await _request_queue.get()]
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                batch.append(await asyncio.wait_for(
+                    _request_queue.get(), timeout=MAX_LATENCY_MS / 1000
+                ))
+            except asyncio.TimeoutError:
+                break
+
+        rows = [row for row, _ in batch]
+        try:
+            # Run the blocking model call in a worker thread: XGBoost
+            # releases the GIL in its C core, so the event loop keeps
+            # accepting and serializing requests while the batch computes
+            results = await asyncio.to_thread(predict_many, rows)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+# === HEALTH CHECK ENDPOINT ===
+# CRITICAL: Required for AWS Application Load Balancer health checks
+@app.get("/")
+def root():
+    """
+    Health check endpoint for monitoring and load balancer health checks.
+    """
+    return {"status": "ok"}
+
+# === REQUEST DATA SCHEMA ===
+# Pydantic model for automatic validation and API documentation
+class PlayerData(BaseModel):
+    """
+    Player data schema for churn prediction.
+
+    This schema defines the exact 18 features required for churn prediction.
+    All features match the original dataset structure for consistency.
+    """
+    # extra='forbid' rejects unknown fields up front, and Literal-typed
+    # categoricals validate as constant-time membership checks in
+    # pydantic-core's Rust validator
+    model_config = ConfigDict(extra="forbid")
+
+    gender: Literal["Female", "Male"]
+    SeniorCitizen: Literal[0, 1]
+    Partner: Literal["Yes", "No"]
+    Dependents: Literal["Yes", "No"]
+    tenure: conint(ge=0, le=100)
+    PhoneService: Literal["Yes", "No"]
+    MultipleLines: Literal["Yes", "No", "No phone service"]
+    InternetService: Literal["DSL", "Fiber optic", "No"]
+    OnlineSecurity: Literal["Yes", "No", "No internet service"]
+    OnlineBackup: Literal["Yes", "No", "No internet service"]
+    DeviceProtection: Literal["Yes", "No", "No internet service"]
+    TechSupport: Literal["Yes", "No", "No internet service"]
+    StreamingTV: Literal["Yes", "No", "No internet service"]
+    StreamingMovies: Literal["Yes", "No", "No internet service"]
+    Contract: Literal["Month-to-month", "One year", "Two year"]
+    PaperlessBilling: Literal["Yes", "No"]
+    PaymentMethod: Literal[
+        "Electronic check",
+        "Mailed check",
+        "Bank transfer (automatic)",
+        "Credit card (automatic)",
+    ]
+    MonthlyCharges: confloat(ge=0)
+
+
+# === MAIN PREDICTION API ENDPOINT ===
+@app.post("/predict", response_class=ORJSONResponse)
+async def get_prediction(data: PlayerData):
+    """
+    Main prediction endpoint for player churn prediction.
+
+    This endpoint:
+    1. Receives validated player data via Pydantic model
+    2. Enqueues the row for the dynamic-batching worker and awaits its result
+    3. Returns churn prediction in JSON format
+
+    Expected Response:
+    - {"prediction": "Likely to churn"} or {"prediction": "Not likely to churn"}
+    - {"error": "error_message"} if prediction fails
+    """
+
+    try:
+        # Hand the row to the batching worker and wait for its slice of the
+        # batched prediction; concurrent requests share one model call
+        future = asyncio.get_running_loop().create_future()
+        # model_dump() is the Pydantic v2 (Rust-core) serializer, a few
+        # times faster than the deprecated .dict()
+        await _request_queue.put((data.model_dump(), future))
+        return {"prediction": await future}
+    except Exception as e:
+        # Return error details for debugging (consider logging in production)
+        return {"error": str(e)}
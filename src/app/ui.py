@@ -0,0 +1,139 @@
+"""
+GRADIO DEMO UI - Manual Testing and Demonstrations
+==================================================
+
+Demo-only entry point, kept OUT of the production image: Gradio and its
+transitive dependencies stay off the serving containers, shrinking image
+size and per-worker memory. Runs as its own process and calls the same
+inference pipeline the API uses.
+
+Run locally with:
+    python -m src.app.ui
+"""
+
+import gradio as gr
+
+from src.serving.inference import predict_many  # Core ML inference logic
+
+
+# === GRADIO WEB INTERFACE ===
+# Declared batch-first (see batch=True below): Gradio hands each argument
+# as a list covering all queued submissions — example rows, concurrent
+# users — and the whole group goes through ONE vectorized model call
+def gradio_interface(
+        genders, senior_citizens, partners, dependents, tenures,
+        phone_services, multiple_lines, internet_services, online_securities,
+        online_backups, device_protections, tech_supports, streaming_tvs,
+        streaming_movies, contracts, paperless_billings, payment_methods,
+        monthly_charges,
+):
+    """
+    Batched Gradio interface function returning one prediction per row.
+
+    This function:
+    1. Takes lists of form inputs (one entry per queued submission)
+    2. Constructs data dictionaries matching the API schema
+    3. Calls the same vectorized inference pipeline used by the API
+    4. Returns user-friendly prediction strings
+
+    """
+    # Construct data dictionaries matching PlayerData schema
+    rows = [
+        {
+            "gender": gender,
+            "SeniorCitizen": int(senior),
+            "Partner": partner,
+            "Dependents": dependent,
+            "tenure": int(tenure),
+            "PhoneService": phone,
+            "MultipleLines": lines,
+            "InternetService": internet,
+            "OnlineSecurity": security,
+            "OnlineBackup": backup,
+            "DeviceProtection": protection,
+            "TechSupport": support,
+            "StreamingTV": tv,
+            "StreamingMovies": movies,
+            "Contract": contract,
+            "PaperlessBilling": paperless,
+            "PaymentMethod": payment,
+            "MonthlyCharges": float(charges),
+        }
+        for (
+            gender, senior, partner, dependent, tenure, phone, lines,
+            internet, security, backup, protection, support, tv, movies,
+            contract, paperless, payment, charges,
+        ) in zip(
+            genders, senior_citizens, partners, dependents, tenures,
+            phone_services, multiple_lines, internet_services,
+            online_securities, online_backups, device_protections,
+            tech_supports, streaming_tvs, streaming_movies, contracts,
+            paperless_billings, payment_methods, monthly_charges,
+        )
+    ]
+
+    # Call same vectorized inference pipeline as API endpoint
+    return [str(result) for result in predict_many(rows)]
+
+# === GRADIO UI CONFIGURATION ===
+# Build comprehensive Gradio interface with all player features
+demo = gr.Interface(
+    fn=gradio_interface,
+    inputs=[
+        gr.Radio(["Female", "Male"], label="Gender"),
+        gr.Radio([0, 1], label="Senior Citizen"),
+        gr.Radio(["Yes", "No"], label="Partner"),
+        gr.Radio(["Yes", "No"], label="Dependents"),
+        gr.Slider(0, 100, step=1, label="Tenure (months)"),
+        gr.Radio(["Yes", "No"], label="Phone Service"),
+        gr.Radio(["Yes", "No", "No phone service"], label="Multiple Lines"),
+        gr.Radio(["DSL", "Fiber optic", "No"], label="Internet Service"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Online Security"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Online Backup"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Device Protection"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Tech Support"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Streaming TV"),
+        gr.Radio(["Yes", "No", "No internet service"], label="Streaming Movies"),
+        gr.Radio(["Month-to-month", "One year", "Two year"], label="Contract"),
+        gr.Radio(["Yes", "No"], label="Paperless Billing"),
+        gr.Radio(
+            [
+                "Electronic check",
+                "Mailed check",
+                "Bank transfer (automatic)",
+                "Credit card (automatic)",
+            ],
+            label="Payment Method",
+        ),
+        gr.Number(label="Monthly Charges"),
+    ],
+    outputs=gr.Textbox(label="Churn Prediction", lines=2),
+    title="🔮 WoW Player Churn Predictor",
+    description="""
+    **Predict player churn probability using machine learning**
+
+    Fill in the player details below to get a churn prediction. The model uses XGBoost trained on
+    historical WoW player data to identify players at risk of churning.
+
+    💡 **Tip**: Short tenure on a month-to-month contract is the strongest churn signal — try it.
+    """,
+    examples=[
+        [
+            "Female", 0, "Yes", "No", 1, "No", "No phone service", "DSL",
+            "No", "Yes", "No", "No", "No", "No", "Month-to-month", "Yes",
+            "Electronic check", 29.85,
+        ],
+        [
+            "Male", 0, "No", "No", 45, "Yes", "No", "Fiber optic",
+            "No", "No", "Yes", "No", "Yes", "Yes", "Two year", "No",
+            "Bank transfer (automatic)", 89.10,
+        ],
+    ],
+    theme=gr.themes.Soft(),  # Professional appearance
+    batch=True,              # Hand queued submissions to fn as lists
+    max_batch_size=32,       # Matches the API-side batching window
+)
+
+
+if __name__ == "__main__":
+    demo.launch()
@@ -1,37 +1,208 @@
+import os
+import pickle
+import tempfile
+
 import mlflow
+import numpy as np
 import pandas as pd
+import mlflow.sklearn
 import mlflow.xgboost
 from xgboost import XGBClassifier
+from sklearn.preprocessing import OneHotEncoder
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score
-from sklearn.metrics import recall_score
+from sklearn.metrics import confusion_matrix
+
+
+# Deterministic binary feature mappings applied during preprocessing.
+# Persisted with the feature schema so serving reads the exact training
+# encoding instead of maintaining its own copy.
+BINARY_MAP = {
+    "gender": {"Female": 0, "Male": 1},
+    "Partner": {"No": 0, "Yes": 1},
+    "Dependents": {"No": 0, "Yes": 1},
+    "PhoneService": {"No": 0, "Yes": 1},
+    "PaperlessBilling": {"No": 0, "Yes": 1},
+}
+
+
+def _build_feature_schema(feature_cols) -> dict:
+    """
+    Precompute the serving-side encoding maps for the trained feature set.
+
+    Serving otherwise re-parses feature_columns.txt and rebuilds these
+    dicts in every worker process at startup; shipping them precomputed in
+    one pickle shaves per-worker cold-start time.
+    """
+    numeric_idx = {
+        col: i for i, col in enumerate(feature_cols)
+        if col in BINARY_MAP or "_" not in col
+    }
+    onehot_idx = {
+        tuple(col.split("_", 1)): i
+        for i, col in enumerate(feature_cols)
+        if col not in numeric_idx
+    }
+    return {
+        "cols": list(feature_cols),
+        "numeric_idx": numeric_idx,
+        "onehot_idx": onehot_idx,
+        "binary_map": BINARY_MAP,
+    }
+
+
+def _encode_features(X: pd.DataFrame):
+    """
+    Encode raw features with BINARY_MAP plus a fitted OneHotEncoder.
+
+    Unlike pd.get_dummies, the fitted encoder pins the category set at
+    training time and is persisted as an artifact, so serving gets a
+    guaranteed-aligned float32 matrix and unseen categories are ignored
+    instead of silently shifting columns (no train/serve skew).
+
+    Args:
+        X (pd.DataFrame): Raw features, categoricals still as strings.
+
+    Returns:
+        (pd.DataFrame, OneHotEncoder | None): encoded features and the
+        fitted encoder (None when X has no categorical columns).
+    """
+    X = X.copy()
+    for col, mapping in BINARY_MAP.items():
+        if col in X.columns:
+            X[col] = X[col].map(mapping)
+
+    cat_cols = [col for col in X.columns if X[col].dtype == object]
+    if not cat_cols:
+        # Already numeric (pre-encoded input): nothing to fit
+        return X.astype(np.float32), None
+
+    enc = OneHotEncoder(
+        drop="first",
+        handle_unknown="ignore",
+        sparse_output=False,
+        dtype=np.float32,
+    )
+    onehot = pd.DataFrame(
+        enc.fit_transform(X[cat_cols]),
+        columns=enc.get_feature_names_out(cat_cols),
+        index=X.index,
+    )
+    return pd.concat([X.drop(columns=cat_cols).astype(np.float32), onehot], axis=1), enc
+
+
+def _export_onnx(model, num_features: int, output_path: str):
+    """
+    Export the trained classifier as an ONNX graph for native serving.
+
+    ONNX Runtime evaluates the TreeEnsembleClassifier op with precompiled
+    SIMD kernels and no Python per call, so serving can run the whole
+    predict as one session.run. The converter is an optional dependency:
+    without onnxmltools the export is skipped and serving falls back to
+    the native Booster.
+
+    Args:
+        output_path: Where to write the ONNX graph.
+
+    Returns:
+        bool: True if the graph was written, False if export was skipped.
+    """
+    try:
+        from onnxmltools.convert import convert_xgboost
+        from onnxmltools.convert.common.data_types import FloatTensorType
+    except ImportError:
+        print("⚠️ onnxmltools not installed; skipping ONNX export")
+        return False
+
+    onx = convert_xgboost(
+        model, initial_types=[("input", FloatTensorType([None, num_features]))]
+    )
+    with open(output_path, "wb") as f:
+        f.write(onx.SerializeToString())
+    return True
+
+
+def _cuda_available() -> bool:
+    """Probe for a usable CUDA device without making torch a hard dependency."""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
 
 def train_model(df: pd.DataFrame, target_col: str):
     """
-    Trains an {{model_name}} model and logs with MLflow.
+    Trains an XGBoost model and logs with MLflow.
 
     Args:
         df (pd.DataFrame): Feature dataset.
         target_col (str): Name of the target column.
     """
-    #### TODO
+    X, encoder = _encode_features(df.drop(columns=[target_col]))
+    y = df[target_col]
+
+    # Stratified split keeps the churn ratio identical in train and test
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42, stratify=y
+    )
 
+    # Histogram split finding is O(n) binning vs. exact's per-split sorts;
+    # run on GPU when one is available, otherwise use every CPU core
+    device = "cuda" if _cuda_available() else "cpu"
+    model = XGBClassifier(
+        n_estimators=300,
+        tree_method="hist",
+        device=device,
+        n_jobs=os.cpu_count(),
+        enable_categorical=False,
+    )
 
     with mlflow.start_run():
             # Train model
             model.fit(X_train, y_train)
             preds = model.predict(X_test)
-            acc = accuracy_score(y_test, preds)
-            rec = recall_score(y_test, preds)
+            # One confusion-matrix pass yields both metrics instead of
+            # scanning the prediction vector once per score
+            tn, fp, fn, tp = confusion_matrix(y_test, preds).ravel()
+            acc = (tp + tn) / (tp + tn + fp + fn)
+            rec = tp / (tp + fn) if (tp + fn) else 0.0
 
             # Log params, metrics, and model
             mlflow.log_param("n_estimators", 300)
-            mlflow.log_metric("accuracy", acc)
-            mlflow.log_metric("recall", rec)
-            mlflow.xgboost.log_model(model, "model")
+            mlflow.log_param("tree_method", "hist")
+            mlflow.log_param("device", device)
+            mlflow.log_metrics({"accuracy": acc, "recall": rec})
+            # Save the model and every serving artifact into ONE local
+            # directory and log that directory under the run's "model"
+            # artifact path. MLflow 3.x stores log_model output outside
+            # the run's artifact tree, so pairing log_model with
+            # log_artifact would scatter the MLmodel and the schema files
+            # across two locations and break serving's contract that
+            # MODEL_DIR contains them side by side.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                model_dir = os.path.join(tmp_dir, "model")
+                mlflow.xgboost.save_model(model, model_dir)
+
+                # Persist the feature schema next to the model: the
+                # plain-text column list for inspection, plus the
+                # precomputed encoding maps serving loads in one pickle read
+                with open(os.path.join(model_dir, "feature_columns.txt"), "w") as f:
+                    f.write("\n".join(X.columns) + "\n")
+                with open(os.path.join(model_dir, "feature_schema.pkl"), "wb") as f:
+                    pickle.dump(_build_feature_schema(X.columns), f)
+
+                # Optional ONNX export for the onnxruntime serving fast path
+                _export_onnx(model, X.shape[1], os.path.join(model_dir, "model.onnx"))
+
+                mlflow.log_artifacts(model_dir, artifact_path="model")
+
+            if encoder is not None:
+                # Fitted encoder ships with the run so serving can rebuild
+                # its category maps from the exact training vocabulary
+                mlflow.sklearn.log_model(encoder, "encoder")
 
             # 🔑 Log dataset so it shows in MLflow UI
             train_ds = mlflow.data.from_pandas(df, source="training_data")
             mlflow.log_input(train_ds, context="training")
 
-            print(f"Model trained. Accuracy: {acc:.4f}, Recall: {rec:.4f}")
\ No newline at end of file
+            print(f"Model trained. Accuracy: {acc:.4f}, Recall: {rec:.4f}")
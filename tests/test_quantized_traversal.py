@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+xgb = pytest.importorskip("xgboost")
+pytest.importorskip("numba")
+pytest.importorskip("mlflow")
+
+from src.serving import inference
+
+
+def test_quantized_traversal_matches_booster():
+    """The packed binned traversal must label exactly like the Booster."""
+    rng = np.random.default_rng(0)
+    n_rows, n_features = 500, 8
+    X = rng.random((n_rows, n_features)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] > 1.0).astype(int)
+
+    model = xgb.XGBClassifier(n_estimators=25, max_depth=4, tree_method="hist")
+    model.fit(X, y)
+    booster = model.get_booster()
+
+    # _build_quantized_trees resolves split names through FEATURE_COLS
+    saved_cols = inference.FEATURE_COLS
+    inference.FEATURE_COLS = [f"f{i}" for i in range(n_features)]
+    try:
+        quant = inference._build_quantized_trees(booster)
+
+        # The load-time gate itself must pass for this booster
+        assert inference._quant_parity_check(quant, booster, n_features)
+
+        # Fresh probe rows, not the ones the parity check generates
+        probes = rng.random((256, n_features)).astype(np.float32)
+        expected = (booster.inplace_predict(probes) >= 0.5).astype(np.int64)
+        np.testing.assert_array_equal(
+            inference._quant_predict(probes, quant), expected
+        )
+    finally:
+        inference.FEATURE_COLS = saved_cols